@@ -1,5 +1,6 @@
 import asyncio
 
+import discord.utils
 from audino import HealthTracker
 from malamar import Application
 from rayquaza import Mediator
@@ -10,6 +11,8 @@ from bot.configuration import Configuration
 from bot.gtfs import GtfsDataStore, GtfsProvider, RealtimeGtfsHandler, StaticGtfsHandler
 from bot.hooks import ALL_HOOKS, Hook
 
+discord.utils.setup_logging()
+
 mediator = Mediator()
 health_tracker = HealthTracker(mediator=mediator)
 
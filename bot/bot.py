@@ -1,45 +1,67 @@
 import asyncio
 import logging
-from collections import defaultdict
-from hashlib import md5
-from json import dumps
-from typing import TYPE_CHECKING, Any, Awaitable, Callable
+import pickle
+from hashlib import blake2b
+from typing import Any, Awaitable, Callable
 
 import discord
 import discord.app_commands
-import discord.ext
-import discord.ext.commands
 from audino import HealthTracker
 from malamar import Application, Service
 from rayquaza import Mediator
 
 from .configuration import Configuration
+from .health import HealthStatusId
 from .hooks import Hook
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+__all__ = (
+    "Commands",
+    "TrainBot",
+)
+
+
 _log = logging.getLogger(__name__)
 
 
 Commands = discord.app_commands.Command | discord.app_commands.ContextMenu | discord.app_commands.Group
 
 
-def _get_commands_hash(command_tree: discord.app_commands.CommandTree) -> int:
-    """Generate a hashcode for the command tree."""
-    assert command_tree.client.user is not None
-    hashcode = command_tree.client.user.id
+def _serialize_command(data: dict[str, Any]) -> bytes:
+    """Serializes command data into bytes for hashing.
+
+    orjson is used when it is available, otherwise the data is pickled. Pickled output is only stable for a
+    given Python version, which is fine as a changed hash only causes the command tree to be synced again.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
 
-    for command in command_tree.walk_commands():
-        data = dumps(command.to_dict(command_tree)).encode("utf-8")
-        hashcode = (hashcode * 397) ^ int.from_bytes(md5(data).digest())
 
-    for context_menu in command_tree.walk_commands(type=discord.AppCommandType.message):
-        data = dumps(context_menu.to_dict(command_tree)).encode("utf-8")
-        hashcode = (hashcode * 397) ^ int.from_bytes(md5(data).digest())
+def _get_commands_hash(command_tree: discord.app_commands.CommandTree) -> int:
+    """Generate a hashcode for the command tree.
+
+    xxHash is used when it is available as the hash only needs to detect changes, otherwise a 64-bit BLAKE2b digest is used.
+    """
+    assert command_tree.client.user is not None
+    hasher = xxhash.xxh3_64() if xxhash is not None else blake2b(digest_size=8)
+    hasher.update(command_tree.client.user.id.to_bytes(8, "little"))
 
-    for context_menu in command_tree.walk_commands(type=discord.AppCommandType.user):
-        data = dumps(context_menu.to_dict(command_tree)).encode("utf-8")
-        hashcode = (hashcode * 397) ^ int.from_bytes(md5(data).digest())
+    # Only top level commands are hashed, as a group's payload already includes its subcommands.
+    for command in command_tree.get_commands():
+        hasher.update(_serialize_command(command.to_dict(command_tree)))
+        hasher.update(b"\x00")
 
-    return hashcode
+    return int.from_bytes(hasher.digest(), "little")
 
 
 class TrainBot(discord.Client, Service):
@@ -59,6 +81,7 @@ class TrainBot(discord.Client, Service):
         self.config: Configuration = config
         self.health_tracker: HealthTracker = health_tracker
         self.mediator: Mediator = mediator
+        self.gtfs_available: bool = False
 
         discord.Client.__init__(self, intents=discord.Intents.all())
         Service.__init__(self)
@@ -69,7 +92,7 @@ class TrainBot(discord.Client, Service):
             allowed_installs=discord.app_commands.installs.AppInstallationType(guild=True, user=True),
         )
 
-        self._event_hooks = defaultdict(list)
+        self._event_hooks: dict[str, tuple[Callable[..., Awaitable[Any]], ...]] = {}
 
         for hook in hooks:
             self.add_hook(hook.callback, hook.event)
@@ -77,21 +100,27 @@ class TrainBot(discord.Client, Service):
         for command in commands:
             self.command_tree.add_command(command)
 
-        discord.ext.commands.Bot
-
-        discord.utils.setup_logging()
-
     def add_hook(self, func: Callable[..., Awaitable[Any]], /, name: str) -> None:
         if not asyncio.iscoroutinefunction(func):
             raise TypeError("Listeners must be coroutines")
-        self._event_hooks[name].append(func)
+        self._event_hooks[name] = (*self._event_hooks.get(name, ()), func)
 
     def dispatch(self, event: str, /, *args: Any, **kwargs: Any) -> None:
         super().dispatch(event, *args, **kwargs)
-        for hook in self._event_hooks[event]:
-            self._schedule_event(hook, "on_" + event, self, *args, **kwargs)  # type: ignore
+        hooks = self._event_hooks.get(event)
+        if hooks:
+            event_name = "on_" + event
+            for hook in hooks:
+                self._schedule_event(hook, event_name, self, *args, **kwargs)  # type: ignore
+
+    async def _handle_health_update(self, health_status_id: str, healthy: bool) -> None:
+        if health_status_id == HealthStatusId.GTFS_AVAILABLE:
+            self.gtfs_available = healthy
 
     async def setup_hook(self) -> None:
+        # GTFS data may have become available before the bot subscribed to health updates.
+        self.gtfs_available = await self.health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE)
+
         new_hash = _get_commands_hash(self.command_tree)
         if self.config.command_hash != new_hash:
             _log.info("Detected command changes, syncing...")
@@ -103,6 +132,8 @@ class TrainBot(discord.Client, Service):
         _log.info(f"Logged in as {self.user} ({self.user.id})")
 
     async def start(self, *, timeout: float | None = None) -> None:  # type: ignore
+        # Track GTFS availability locally so commands can check it without awaiting the health tracker.
+        self.health_tracker.subscribe(self._handle_health_update)
         await discord.Client.__aenter__(self)
         self.loop.create_task(discord.Client.start(self, self.config.token))
 
@@ -1,5 +1,3 @@
 from .gtfs import TIMETABLE_GROUP
 
-ALL_COMMANDS = [
-    TIMETABLE_GROUP,
-]
+ALL_COMMANDS = (TIMETABLE_GROUP,)
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import datetime
+import time
 from collections.abc import Callable, Coroutine
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 import discord
 import discord.app_commands
 
 from ...gtfs.types import Direction, RouteType
-from ...health import HealthStatusId
-from ...mediator import ChannelNames, GetNextServicesRequest, GetNextTrainsRequest, SearchStopsRequest
+from ...mediator import ChannelNames, GetNextServicesRequest, GetNextTrainsRequest, SearchStopsBatchRequest
 from .timetable_renderer import render_timetable
 
 if TYPE_CHECKING:
@@ -25,22 +28,180 @@ TIMETABLE_GROUP = discord.app_commands.Group(
 )
 
 
+AUTOCOMPLETE_CACHE_TTL = 10
+AUTOCOMPLETE_CACHE_SIZE = 1024
+AUTOCOMPLETE_BATCH_WINDOW = 0.01
+
+_AutocompleteKey = tuple[RouteType, bool, str]
+
+_autocomplete_cache: dict[_AutocompleteKey, tuple[float, list[discord.app_commands.Choice[str]]]] = {}
+
+
+# Futures of the autocomplete queries for a route type that are waiting to be sent as a single search request.
+_pending_batches: dict[tuple[RouteType, bool], dict[str, asyncio.Future[list[discord.app_commands.Choice[str]]]]] = {}
+# References to the running batch requests, so that they aren't garbage collected before they finish.
+_batch_tasks: set[asyncio.Task[None]] = set()
+
+
+async def _send_batch(
+    client: TrainBot, route_type: RouteType, parent_only: bool, futures: dict[str, asyncio.Future[list[discord.app_commands.Choice[str]]]]
+) -> None:
+    queries = list(futures)
+    request = SearchStopsBatchRequest(queries=queries, route_type=route_type, parent_only=parent_only, limit=MAX_SEARCH_RESULTS)
+
+    error: Exception = RuntimeError("The stop search did not return results for the query.")
+    try:
+        result = await client.mediator.request(ChannelNames.GTFS, request)
+        for query, stops in zip(queries, result.stops):
+            future = futures[query]
+            if not future.done():
+                future.set_result(
+                    [
+                        discord.app_commands.Choice(name=f"{stop.name} ({stop.id})", value=stop.id)
+                        for stop in islice(stops, MAX_SEARCH_RESULTS)
+                    ]
+                )
+    except asyncio.CancelledError:
+        # The waiters weren't cancelled themselves, so they are failed rather than cancelled.
+        error = RuntimeError("The stop search was cancelled.")
+        raise
+    except Exception as e:
+        error = e
+    finally:
+        # Fail anything left unresolved so that its waiters don't hang, e.g. if fewer results were returned than queries.
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(error)
+
+
+def _retrieve_exception(future: asyncio.Future[list[discord.app_commands.Choice[str]]]) -> None:
+    # Waiters may have gone away by the time a search fails, so mark the exception as retrieved to avoid it being logged.
+    if not future.cancelled():
+        future.exception()
+
+
+def _flush_batch(client: TrainBot, route_type: RouteType, parent_only: bool) -> None:
+    futures = _pending_batches.pop((route_type, parent_only))
+    task = asyncio.create_task(_send_batch(client, route_type, parent_only, futures))
+    _batch_tasks.add(task)
+    task.add_done_callback(_batch_tasks.discard)
+
+
+def _search_stops(client: TrainBot, key: _AutocompleteKey) -> asyncio.Future[list[discord.app_commands.Choice[str]]]:
+    """Queues a stop search, coalescing it with other searches for the same route type made within the batch window.
+    Identical queries made within the window share the same future.
+    """
+    route_type, parent_only, query = key
+
+    futures = _pending_batches.get((route_type, parent_only))
+    if futures is None:
+        futures = _pending_batches[route_type, parent_only] = {}
+        asyncio.get_running_loop().call_later(AUTOCOMPLETE_BATCH_WINDOW, _flush_batch, client, route_type, parent_only)
+
+    future = futures.get(query)
+    if future is None:
+        future = futures[query] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_retrieve_exception)
+
+    return future
+
+
 def _autocomplete(
     route_type: RouteType, *, parent_only: bool = False
 ) -> Callable[[discord.Interaction[TrainBot], str], Coroutine[Any, Any, list[discord.app_commands.Choice[str]]]]:
     async def inner(interaction: discord.Interaction[TrainBot], query: str) -> list[discord.app_commands.Choice[str]]:
-        if not await interaction.client.health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE):
+        if not interaction.client.gtfs_available:
             return []
 
-        request = SearchStopsRequest(query=query, route_type=route_type, parent_only=parent_only, limit=MAX_SEARCH_RESULTS)
-        result = await interaction.client.mediator.request(ChannelNames.GTFS, request)
-        return [discord.app_commands.Choice(name=f"{stop.name} ({stop.id})", value=stop.id) for stop in result.stops]
+        key = (route_type, parent_only, query.lower())
+        now = time.monotonic()
+
+        cached = _autocomplete_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        # The future may be shared with other identical queries, so it is shielded from this one being cancelled.
+        choices = await asyncio.shield(_search_stops(interaction.client, key))
+
+        if len(_autocomplete_cache) >= AUTOCOMPLETE_CACHE_SIZE:
+            _autocomplete_cache.pop(next(iter(_autocomplete_cache)))
+        _autocomplete_cache[key] = (now + AUTOCOMPLETE_CACHE_TTL, choices)
+
+        return choices
 
     return inner
 
 
-def _with_code_block(text: str, language: str) -> str:
-    return f"```{language}\n{text}\n```"
+_ANSI_CODE_BLOCK_START = "```ansi\n"
+_CODE_BLOCK_END = "\n```"
+
+
+def _with_ansi_code_block(text: str) -> str:
+    return "".join((_ANSI_CODE_BLOCK_START, text, _CODE_BLOCK_END))
+
+
+def _local_now(interaction: discord.Interaction[TrainBot]) -> datetime.datetime:
+    return interaction.created_at.astimezone(interaction.client.config.local_timezone)
+
+
+_EMBED_TEMPLATES = {
+    RouteType.RAIL: discord.Embed(colour=discord.Colour.red()),
+    RouteType.BUS: discord.Embed(colour=discord.Colour.pink()),
+    RouteType.TRAM: discord.Embed(colour=discord.Colour.gold()),
+    RouteType.FERRY: discord.Embed(colour=discord.Colour.blue()),
+}
+
+_TIMETABLE_LABELS = {
+    RouteType.RAIL: "Train",
+    RouteType.BUS: "Bus",
+    RouteType.TRAM: "Tram",
+    RouteType.FERRY: "Ferry",
+}
+
+
+async def _send_timetable(
+    interaction: discord.Interaction[TrainBot],
+    route_type: RouteType,
+    stop_id: str,
+    max_results: int | None,
+    private: bool,
+    direction: Direction | None = None,
+) -> None:
+    """Retrieves and sends the timetable for the given stop and route type."""
+    if not interaction.client.gtfs_available:
+        await interaction.response.send_message("GTFS data is currently unavailable.", ephemeral=True)
+        return
+
+    # Defer so that slow GTFS lookups don't exceed Discord's initial response window.
+    await interaction.response.defer(ephemeral=private, thinking=True)
+
+    max_results = max_results or interaction.client.config.default_max_results[route_type]
+
+    try:
+        if route_type is RouteType.RAIL:
+            request = GetNextTrainsRequest(stop_id=stop_id, time=interaction.created_at, max_results=max_results)
+            stop, down_trains, up_trains = await interaction.client.mediator.request(ChannelNames.GTFS, request)
+            services = [*down_trains, *up_trains]
+        else:
+            request = GetNextServicesRequest(stop_id=stop_id, route_type=route_type, time=interaction.created_at, max_results=max_results)
+            stop, services = await interaction.client.mediator.request(ChannelNames.GTFS, request)
+
+        now = _local_now(interaction)
+        lookahead_hours = interaction.client.config.lookahead_window[route_type]
+
+        rendered = render_timetable(stop, now, services, route_type, lookahead_hours, max_results, direction)
+    except Exception:
+        # Remove the deferred "thinking..." response, which may be public, so that the error can be sent privately.
+        await interaction.delete_original_response()
+        await interaction.followup.send("Failed to retrieve timetable.", ephemeral=True)
+        raise
+
+    embed = _EMBED_TEMPLATES[route_type].copy()
+    embed.description = _with_ansi_code_block(rendered)
+    embed.timestamp = interaction.created_at
+    embed.set_author(icon_url=TRANSLINK_LOGO, name=f"{stop.name} {_TIMETABLE_LABELS[route_type]} Timetable", url=stop.url)
+
+    await interaction.followup.send(embed=embed, ephemeral=private)
 
 
 @TIMETABLE_GROUP.command()
@@ -59,37 +220,7 @@ async def train(
     private: bool = False,
 ) -> None:
     """Retrieves the link to the train timetable for the given stop."""
-    if not await interaction.client.health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE):
-        await interaction.response.send_message("GTFS data is currently unavailable.", ephemeral=True)
-        return
-
-    max_results = max_results or interaction.client.config.default_max_results[RouteType.RAIL]
-
-    try:
-        request = GetNextTrainsRequest(stop_id=stop_id, time=interaction.created_at, max_results=max_results)
-        stop, down_trains, up_trains = await interaction.client.mediator.request(ChannelNames.GTFS, request)
-    except Exception:
-        await interaction.response.send_message("Failed to retrieve timetable.", ephemeral=True)
-        raise
-
-    now = interaction.created_at.astimezone(interaction.client.config.local_timezone)
-
-    trains = [*down_trains, *up_trains]
-    lookahead_hours = interaction.client.config.lookahead_window[RouteType.RAIL]
-    timetable = _with_code_block(render_timetable(stop, now, trains, RouteType.RAIL, lookahead_hours, max_results, direction), "ansi")
-
-    await interaction.response.send_message(
-        embed=discord.Embed(
-            description=timetable,
-            timestamp=interaction.created_at,
-            color=discord.Colour.red(),
-        ).set_author(
-            icon_url=TRANSLINK_LOGO,
-            name=f"{stop.name} Train Timetable",
-            url=stop.url,
-        ),
-        ephemeral=private,
-    )
+    await _send_timetable(interaction, RouteType.RAIL, stop_id, max_results, private, direction)
 
 
 @TIMETABLE_GROUP.command()
@@ -106,35 +237,7 @@ async def bus(
     private: bool = False,
 ) -> None:
     """Retrieves the link to the bus timetable for the given stop."""
-    if not await interaction.client.health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE):
-        await interaction.response.send_message("GTFS data is currently unavailable.", ephemeral=True)
-        return
-
-    max_results = max_results or interaction.client.config.default_max_results[RouteType.BUS]
-
-    try:
-        request = GetNextServicesRequest(stop_id=stop_id, route_type=RouteType.BUS, time=interaction.created_at, max_results=max_results)
-        stop, buses = await interaction.client.mediator.request(ChannelNames.GTFS, request)
-    except Exception:
-        await interaction.response.send_message("Failed to retrieve timetable.", ephemeral=True)
-        raise
-
-    now = interaction.created_at.astimezone(interaction.client.config.local_timezone)
-    lookahead_hours = interaction.client.config.lookahead_window[RouteType.BUS]
-    timetable = _with_code_block(render_timetable(stop, now, buses, RouteType.BUS, lookahead_hours, max_results), "ansi")
-
-    await interaction.response.send_message(
-        embed=discord.Embed(
-            description=timetable,
-            timestamp=interaction.created_at,
-            colour=discord.Colour.pink(),
-        ).set_author(
-            icon_url=TRANSLINK_LOGO,
-            name=f"{stop.name} Bus Timetable",
-            url=stop.url,
-        ),
-        ephemeral=private,
-    )
+    await _send_timetable(interaction, RouteType.BUS, stop_id, max_results, private)
 
 
 @TIMETABLE_GROUP.command()
@@ -151,35 +254,7 @@ async def tram(
     private: bool = False,
 ) -> None:
     """Retrieves the link to the tram timetable for the given stop."""
-    if not await interaction.client.health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE):
-        await interaction.response.send_message("GTFS data is currently unavailable.", ephemeral=True)
-        return
-
-    max_results = max_results or interaction.client.config.default_max_results[RouteType.TRAM]
-
-    try:
-        request = GetNextServicesRequest(stop_id=stop_id, route_type=RouteType.TRAM, time=interaction.created_at, max_results=max_results)
-        stop, trams = await interaction.client.mediator.request(ChannelNames.GTFS, request)
-    except Exception:
-        await interaction.response.send_message("Failed to retrieve timetable.", ephemeral=True)
-        raise
-
-    now = interaction.created_at.astimezone(interaction.client.config.local_timezone)
-    lookahead_hours = interaction.client.config.lookahead_window[RouteType.TRAM]
-    timetable = _with_code_block(render_timetable(stop, now, trams, RouteType.TRAM, lookahead_hours, max_results), "ansi")
-
-    await interaction.response.send_message(
-        embed=discord.Embed(
-            description=timetable,
-            timestamp=interaction.created_at,
-            color=discord.Colour.gold(),
-        ).set_author(
-            icon_url=TRANSLINK_LOGO,
-            name=f"{stop.name} Tram Timetable",
-            url=stop.url,
-        ),
-        ephemeral=private,
-    )
+    await _send_timetable(interaction, RouteType.TRAM, stop_id, max_results, private)
 
 
 @TIMETABLE_GROUP.command()
@@ -196,32 +271,4 @@ async def ferry(
     private: bool = False,
 ) -> None:
     """Retrieves the link to the ferry timetable for the given stop."""
-    if not await interaction.client.health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE):
-        await interaction.response.send_message("GTFS data is currently unavailable.", ephemeral=True)
-        return
-
-    max_results = max_results or interaction.client.config.default_max_results[RouteType.FERRY]
-
-    try:
-        request = GetNextServicesRequest(stop_id=stop_id, route_type=RouteType.FERRY, time=interaction.created_at, max_results=max_results)
-        stop, ferries = await interaction.client.mediator.request(ChannelNames.GTFS, request)
-    except Exception:
-        await interaction.response.send_message("Failed to retrieve timetable.", ephemeral=True)
-        raise
-
-    now = interaction.created_at.astimezone(interaction.client.config.local_timezone)
-    lookahead_hours = interaction.client.config.lookahead_window[RouteType.FERRY]
-    timetable = f"```ansi\n{render_timetable(stop, now, ferries, RouteType.FERRY, lookahead_hours, max_results)}\n```"
-
-    await interaction.response.send_message(
-        embed=discord.Embed(
-            description=timetable,
-            timestamp=interaction.created_at,
-            color=discord.Colour.blue(),
-        ).set_author(
-            icon_url=TRANSLINK_LOGO,
-            name=f"{stop.name} Ferry Timetable",
-            url=stop.url,
-        ),
-        ephemeral=private,
-    )
+    await _send_timetable(interaction, RouteType.FERRY, stop_id, max_results, private)
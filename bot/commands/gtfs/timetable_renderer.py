@@ -1,10 +1,11 @@
 import datetime
-from collections.abc import Mapping, Sequence
-from enum import Enum, Flag, auto
+from collections.abc import Iterator, Mapping, Sequence
+from enum import Enum, IntFlag
+from functools import lru_cache
 from random import choice
-from typing import Literal, Self, overload
+from typing import Self
 
-from ...gtfs.types import Direction, RouteType, Stop, StopTimeInstance
+from ...gtfs.types import Direction, RouteType, Stop, StopTimeInstance, TripInstance
 
 _ANSI_ESCAPE = "\033[0;"
 _ANSI_RESET = f"{_ANSI_ESCAPE}0m"
@@ -15,16 +16,18 @@ __all__ = ("render_timetable",)
 
 
 class _DiscordAnsiColour(Enum):
-    """Represents the colours that can be used in Discord messages."""
+    """Represents the colours that can be used in Discord messages.
+    The value of each colour is its ANSI escape code.
+    """
 
-    GREY = auto()
-    RED = auto()
-    YELLOW = auto()
-    GREEN = auto()
-    CYAN = auto()
-    BLUE = auto()
-    MAGENTA = auto()
-    WHITE = auto()
+    GREY = "30"
+    RED = "31"
+    YELLOW = "33"
+    GREEN = "32"
+    CYAN = "36"
+    BLUE = "34"
+    MAGENTA = "35"
+    WHITE = "37"
 
     @classmethod
     def from_colour(cls, colour: str) -> Self:
@@ -42,11 +45,11 @@ class _DiscordAnsiColour(Enum):
         """
         r, g, b = int(colour[:2], 16), int(colour[2:4], 16), int(colour[4:], 16)
 
-        # Find the closest colour
+        # Find the closest colour, ties resolve to the first colour in the map
         closest = cls.GREY
         closest_distance = float("inf")
-        for discord_colour, rgb in _COLOUR_MAP.items():
-            distance = sum((a - b) ** 2 for a, b in zip(rgb, (r, g, b)))
+        for discord_colour, (pr, pg, pb) in _COLOUR_MAP.items():
+            distance = (pr - r) * (pr - r) + (pg - g) * (pg - g) + (pb - b) * (pb - b)
             if distance < closest_distance:
                 closest = discord_colour
                 closest_distance = distance
@@ -67,25 +70,42 @@ class _DiscordAnsiColour(Enum):
         DiscordAnsiColour
             The colour code for the service.
         """
-        if service.trip.route.type is RouteType.RAIL:
+        return _get_trip_colour(service.trip)  # type: ignore
 
-            destination = service.trip.destination
-            while destination.parent_station is not None:
-                destination = destination.parent_station
+    @property
+    def code(self) -> str:
+        """str: The ANSI escape code for the colour."""
+        return self.value
 
-            if _LINES[destination.id] & _Line.INNER_CITY:
-                return _DiscordAnsiColour.GREY  # type: ignore
 
-            short_name = service.trip.route.short_name[-2:]
-        else:
-            short_name = service.trip.route.short_name
+@lru_cache(maxsize=4096)
+def _get_trip_colour(trip: TripInstance) -> _DiscordAnsiColour:
+    """Returns the colour for a trip instance.
+    The colour only depends on the trip's route and destination, so it is cached per trip instance.
 
-        return _ROUTE_COLOURS.get(service.trip.route.type, {}).get(short_name, cls.from_colour(service.trip.route.colour))  # type: ignore
+    Parameters
+    ----------
+    trip : TripInstance
+        The trip instance to get the colour for.
 
-    @property
-    def code(self) -> str:
-        """str: The ANSI escape code for the colour."""
-        return _COLOUR_CODES[self]
+    Returns
+    -------
+    _DiscordAnsiColour
+        The colour for the trip.
+    """
+    route = trip.route
+
+    if route.type is RouteType.RAIL:
+        destination = _get_root_station(trip.destination)
+
+        if _LINES[destination.id] & _Line.INNER_CITY:
+            return _DiscordAnsiColour.GREY
+
+        short_name = route.short_name[-2:]
+    else:
+        short_name = route.short_name
+
+    return _get_route_colour(route.type, short_name, route.colour)
 
 
 _COLOUR_MAP = {
@@ -140,20 +160,115 @@ _ROUTE_COLOURS = {
 }
 
 
-_COLOUR_CODES = {
-    _DiscordAnsiColour.GREY: "30",
-    _DiscordAnsiColour.RED: "31",
-    _DiscordAnsiColour.GREEN: "32",
-    _DiscordAnsiColour.YELLOW: "33",
-    _DiscordAnsiColour.BLUE: "34",
-    _DiscordAnsiColour.MAGENTA: "35",
-    _DiscordAnsiColour.CYAN: "36",
-    _DiscordAnsiColour.WHITE: "37",
+_ROUTE_COLOURS_BY_NAME = {
+    (route_type, short_name): colour for route_type, colours in _ROUTE_COLOURS.items() for short_name, colour in colours.items()
 }
 
 
+@lru_cache(maxsize=512)
+def _get_route_colour(route_type: RouteType, short_name: str, colour: str) -> _DiscordAnsiColour:
+    """Returns the colour for a route, falling back to the closest colour to the route's own colour.
+
+    Parameters
+    ----------
+    route_type : RouteType
+        The type of the route.
+    short_name : str
+        The short name of the route, as used in the route colour table.
+    colour : str
+        The colour of the route, as a hex string.
+
+    Returns
+    -------
+    _DiscordAnsiColour
+        The colour for the route.
+    """
+    result = _ROUTE_COLOURS_BY_NAME.get((route_type, short_name))
+    if result is None:
+        return _DiscordAnsiColour.from_colour(colour)
+    return result
+
+
 _SCREEN_WIDTH = 48
 
+# Clock times for every minute of the day, indexed by hour * 60 + minute, equivalent to strftime("%I:%M") and strftime("%H:%M").
+_TWELVE_HOUR_TIMES = tuple(f"{(minute // 60 - 1) % 12 + 1:02}:{minute % 60:02}" for minute in range(24 * 60))
+_TWENTY_FOUR_HOUR_TIMES = tuple(f"{minute // 60:02}:{minute % 60:02}" for minute in range(24 * 60))
+
+_MINUTES_TEXT = tuple(f"{minutes} min" for minutes in range(60))
+
+_BLANK_BAR = _ZWSP + "\n"
+
+# Service rows are printf-style templates, as % formatting a tuple is quicker than str.format for these short rows.
+_TRAIN_BAR_FORMAT = f"%-7s%-{_SCREEN_WIDTH - 20}s%-7s%6s"
+_TRAIN_BAR_LINE_FORMAT = f"%s{_TRAIN_BAR_FORMAT}{_ANSI_RESET}\n"
+_BUS_ROW_FORMAT = f"%-7s%-{_SCREEN_WIDTH - 13}s%6s"
+_TRAM_ROW_FORMAT = f"Plat%-3s%-{_SCREEN_WIDTH - 14}s%6s"
+_CENTRED_FORMAT = f"{{:^{_SCREEN_WIDTH}}}"
+_TITLE_FORMAT = f"{{:^{_SCREEN_WIDTH - 10}}}"
+_SECTION_HEADER_FORMAT = f"Next Trains {{:<{_SCREEN_WIDTH - 29}}}Platform  Departs\n"
+
+
+def _build_prefixes(bold: bool, underline: bool) -> dict[str | None, str]:
+    """Builds the ANSI escape prefixes for every colour with the given text styles.
+
+    Parameters
+    ----------
+    bold : bool
+        Whether the text should be bold.
+    underline : bool
+        Whether the text should be underlined.
+
+    Returns
+    -------
+    dict[str | None, str]
+        The escape prefix for each colour code, with None for uncoloured text.
+    """
+    prefixes = {}
+
+    for code in (None, *(colour.code for colour in _DiscordAnsiColour)):
+        codes = [] if code is None else [code]
+
+        if bold:
+            codes.append("1")
+        if underline:
+            codes.append("4")
+
+        prefixes[code] = f"{_ANSI_ESCAPE}{";".join(codes)}m"
+
+    return prefixes
+
+
+# Keyed by (bold, underline), then by the colour's ANSI code.
+# The colour's code is used rather than the colour itself, as hashing an enum member runs Python code.
+_PREFIXES = {(bold, underline): _build_prefixes(bold, underline) for bold in (False, True) for underline in (False, True)}
+
+
+def _get_departs_text(departure_time: datetime.datetime, now: datetime.datetime, clock_times: Sequence[str]) -> str:
+    """Returns the text for when a service departs.
+    Services departing within the hour show the minutes until departure, otherwise the departure time is shown.
+
+    Parameters
+    ----------
+    departure_time : datetime.datetime
+        The departure time of the service.
+    now : datetime.datetime
+        The current time.
+    clock_times : Sequence[str]
+        The clock time text for each minute of the day.
+
+    Returns
+    -------
+    str
+        The departure text.
+    """
+    delta = departure_time - now
+    # timedelta.seconds alone wraps around for services which have just departed, so days are included.
+    departs_minutes = delta.days * 1440 + delta.seconds // 60
+    if departs_minutes < 60:
+        return _MINUTES_TEXT[max(departs_minutes, 0)]
+    return clock_times[departure_time.hour * 60 + departure_time.minute]
+
 
 def _with_formatting(text: str, colour: _DiscordAnsiColour | None = None, bold: bool = False, underline: bool = False) -> str:
     """Formats text with ANSI escape codes.
@@ -174,21 +289,11 @@ def _with_formatting(text: str, colour: _DiscordAnsiColour | None = None, bold:
     str
         The formatted text.
     """
+    prefix = _PREFIXES[bold, underline][None if colour is None else colour.code]
+    return f"{prefix}{text.rstrip()}{_ANSI_RESET}"
 
-    codes = []
-
-    if colour is not None:
-        codes.append(colour.code)
 
-    if bold:
-        codes.append("1")
-    if underline:
-        codes.append("4")
-
-    return f"{_ANSI_ESCAPE}{";".join(codes)}m{text.rstrip()}{_ANSI_RESET}"
-
-
-class _Line(Flag):
+class _Line(IntFlag):
     """Represents the train lines in the Brisbane Citytrain network."""
 
     NONE = 0
@@ -223,7 +328,7 @@ NORTHSIDE = _Line.NORTH_COAST | _Line.KIPPA_RING | _Line.SHORNCLIFFE | _Line.AIR
 SOUTHSIDE = _Line.CLEVELAND | _Line.GOLD_COAST | _Line.SPRINGFIELD | _Line.ROSEWOOD
 
 
-class _CardinalDirection(Flag):
+class _CardinalDirection(IntFlag):
     """Represents a cardinal direction."""
 
     NONE = 0
@@ -247,36 +352,77 @@ _OUTBOUND_DIRECTIONS = {
 }
 
 
-def _get_header_text(stop_id: str, max_services: int, slim: bool = False) -> Mapping[Direction, str]:
-    """Returns the header text for a train timetable.
+# The "/" separated names of every combination of cardinal directions, indexed by the combination's value.
+_CARDINAL_DIRECTION_TEXT = tuple(
+    "/".join(orientation.name.title() for orientation in _CardinalDirection if orientation.value & value)  # type: ignore
+    for value in range(1 << len(_CardinalDirection))
+)
+
+
+_LINES_BY_BIT = {line.value: line for line in _Line if line.value}
+
+
+def _iter_lines(line: _Line) -> Iterator[_Line]:
+    """Iterates over the individual lines in a set of lines, one set bit at a time.
 
     Parameters
     ----------
-    stop_id : str
-        The stop ID.
-    slim : bool, optional
-        Whether to render the slim version of the text.
+    line : _Line
+        The set of lines.
+
+    Yields
+    ------
+    _Line
+        Each line in the set.
+    """
+    value = line.value
+    while value:
+        bit = value & -value
+        yield _LINES_BY_BIT[bit]
+        value ^= bit
+
+
+def _get_outbound_orientation_text(line: _Line) -> str:
+    """Returns the outbound orientation text for a set of lines, e.g. "South/East".
+
+    Parameters
+    ----------
+    line : _Line
+        The lines.
 
     Returns
     -------
-    Mapping[Direction, str]
-        The header text for the line for each direction.
+    str
+        The outbound orientation text.
     """
-    if _LINES[stop_id] is _Line.INNER_CITY:
-        if slim:
-            return {Direction.UPWARD: "South/West", Direction.DOWNWARD: "North"}
-        return {Direction.UPWARD: f"(1-{max_services}) South/West", Direction.DOWNWARD: f"(1-{max_services}) North"}
-
     outbound_orientation = _CardinalDirection.NONE
-    line = _LINES[stop_id]
 
-    for line_ in _Line:
-        if line_ is not _Line.INNER_CITY and line & line_:
-            outbound_orientation |= _OUTBOUND_DIRECTIONS[line_]
+    for line_ in _iter_lines(line & ~_Line.INNER_CITY):
+        outbound_orientation |= _OUTBOUND_DIRECTIONS[line_]
 
-    outbound_orientation_text = "/".join(
-        orientation.name.title() for orientation in _CardinalDirection if outbound_orientation & orientation  # type: ignore
-    )
+    return _CARDINAL_DIRECTION_TEXT[outbound_orientation.value]
+
+
+@lru_cache(maxsize=None)
+def _build_header_text(line: _Line) -> Mapping[Direction, str]:
+    """Builds the header text for a train timetable at stations on the given lines.
+    For inner-city stations this is the slim version of the text.
+    This is cached per set of lines, so it is only built the first time a station on those lines is rendered.
+
+    Parameters
+    ----------
+    line : _Line
+        The lines of the station.
+
+    Returns
+    -------
+    Mapping[Direction, str]
+        The header text for the line for each direction.
+    """
+    if line is _Line.INNER_CITY:
+        return {Direction.UPWARD: "South/West", Direction.DOWNWARD: "North"}
+
+    outbound_orientation_text = _get_outbound_orientation_text(line)
 
     if line & NORTHSIDE:
         upward_text = "City & South/West"
@@ -288,6 +434,32 @@ def _get_header_text(stop_id: str, max_services: int, slim: bool = False) -> Map
     return {Direction.DOWNWARD: downward_text, Direction.UPWARD: upward_text}
 
 
+def _get_header_text(stop_id: str, max_services: int, slim: bool = False) -> Mapping[Direction, str]:
+    """Returns the header text for a train timetable.
+
+    Parameters
+    ----------
+    stop_id : str
+        The stop ID.
+    max_services : int
+        The maximum number of services shown, this is only included in the full text for inner-city stations.
+    slim : bool, optional
+        Whether to render the slim version of the text.
+
+    Returns
+    -------
+    Mapping[Direction, str]
+        The header text for the line for each direction.
+        This mapping may be shared between calls, so it must not be modified.
+    """
+    line = _LINES[stop_id]
+
+    if line is _Line.INNER_CITY and not slim:
+        return {Direction.UPWARD: f"(1-{max_services}) South/West", Direction.DOWNWARD: f"(1-{max_services}) North"}
+
+    return _build_header_text(line)
+
+
 def _get_inbound_direction(stop_id: str) -> Direction:
     """Returns the inbound direction for a stop.
 
@@ -301,12 +473,7 @@ def _get_inbound_direction(stop_id: str) -> Direction:
     Direction
         The inbound direction.
     """
-    line = _LINES[stop_id]
-
-    if line & NORTHSIDE:
-        return Direction.UPWARD
-    else:
-        return Direction.DOWNWARD
+    return _INBOUND_DIRECTIONS[stop_id]
 
 
 # TODO: Figure out how to do this without hardcoding the stop IDs
@@ -468,6 +635,12 @@ _LINES = {
     # fmt: on
 }
 
+_INNER_CITY_STATIONS = frozenset(stop_id for stop_id, line in _LINES.items() if line is _Line.INNER_CITY)
+
+_INBOUND_DIRECTIONS = {stop_id: Direction.UPWARD if line & NORTHSIDE else Direction.DOWNWARD for stop_id, line in _LINES.items()}
+
+_END_OF_LINE_DIRECTIONS = {stop_id: _INBOUND_DIRECTIONS[stop_id] for stop_id in _END_OF_LINE}
+
 STATION_RENAMES = {
     "place_intsta": "Airport",
     "place_kprsta": "Redcliffe",
@@ -498,6 +671,81 @@ NO_TRAINS_SLIM_TEXT = [
 ]
 
 
+def _render_notice_line(line: str) -> str:
+    """Renders a single centred line of a notice, such as the no trains text.
+
+    Parameters
+    ----------
+    line : str
+        The line to render.
+
+    Returns
+    -------
+    str
+        The rendered line.
+    """
+    return _with_formatting(_CENTRED_FORMAT.format(line), _DiscordAnsiColour.WHITE)
+
+
+def _compile_notice(lines: Sequence[str]) -> tuple[tuple[str, bool], ...]:
+    """Pre-renders the lines of a notice that have no placeholders.
+
+    Parameters
+    ----------
+    lines : Sequence[str]
+        The lines of the notice, which may contain format placeholders.
+
+    Returns
+    -------
+    tuple[tuple[str, bool], ...]
+        Each line, paired with whether it is a template which still needs to be formatted and rendered.
+    """
+    return tuple((line, True) if "{" in line else (_render_notice_line(line), False) for line in lines)
+
+
+def _render_notice(notice: tuple[tuple[str, bool], ...], values: Mapping[str, object]) -> str:
+    """Renders a compiled notice.
+
+    Parameters
+    ----------
+    notice : tuple[tuple[str, bool], ...]
+        The compiled notice.
+    values : Mapping[str, object]
+        The values to substitute into the notice's templates.
+
+    Returns
+    -------
+    str
+        The rendered notice.
+    """
+    return "\n".join(_render_notice_line(line.format_map(values)) if is_template else line for line, is_template in notice)
+
+
+_NO_TRAINS_NOTICE = _compile_notice(NO_TRAINS_TEXT)
+_NO_TRAINS_SLIM_NOTICE = _compile_notice(NO_TRAINS_SLIM_TEXT)
+
+
+@lru_cache(maxsize=4096)
+def _get_root_station(stop: Stop) -> Stop:
+    """Returns the top-level station a stop belongs to, or the stop itself if it has no parent station.
+
+    Parameters
+    ----------
+    stop : Stop
+        The stop.
+
+    Returns
+    -------
+    Stop
+        The root station.
+    """
+    while stop.parent_station is not None:
+        stop = stop.parent_station
+
+    return stop
+
+
+@lru_cache(maxsize=4096)
 def _get_station_name(stop: Stop) -> str:
     """Returns the name of a station for use in a train bar.
 
@@ -511,8 +759,7 @@ def _get_station_name(stop: Stop) -> str:
     str
         The name of the station.
     """
-    while stop.parent_station is not None:
-        stop = stop.parent_station
+    stop = _get_root_station(stop)
 
     if stop.id in STATION_RENAMES:
         return STATION_RENAMES[stop.id]
@@ -520,6 +767,28 @@ def _get_station_name(stop: Stop) -> str:
     return stop.name.split(" station", 1)[0]
 
 
+@lru_cache(maxsize=4096)
+def _get_last_inner_city_sequence(trip: TripInstance) -> int | None:
+    """Returns the sequence of the last inner-city stop a trip calls at.
+
+    Parameters
+    ----------
+    trip : TripInstance
+        The trip instance.
+
+    Returns
+    -------
+    int | None
+        The sequence of the last inner-city stop, or None if the trip does not pass through the inner city.
+    """
+    result = None
+    for stop_time_instance in trip.stop_times:
+        if _get_root_station(stop_time_instance.stop).id in _INNER_CITY_STATIONS:
+            result = stop_time_instance.sequence if result is None else max(result, stop_time_instance.sequence)
+
+    return result
+
+
 def _is_city_service(service: StopTimeInstance) -> bool:
     """Checks if a service is a city service.
     A service is defined as a city service if a subsequent stop is an inner-city station.
@@ -534,53 +803,37 @@ def _is_city_service(service: StopTimeInstance) -> bool:
     bool
         True if the service is a city service, False otherwise.
     """
-    stop = service.stop
-    while stop.parent_station is not None:
-        stop = stop.parent_station
+    if _get_root_station(service.stop).id in _INNER_CITY_STATIONS:
+        return False
 
-    if _LINES[stop.id] is not _Line.INNER_CITY:
-        for stop_time_instance in service.trip.stop_times:
-            if stop_time_instance.sequence > service.sequence:
-                stop = stop_time_instance.stop
-                while stop.parent_station is not None:
-                    stop = stop.parent_station
-                if _LINES[stop.id] is _Line.INNER_CITY:
-                    return True
+    last_inner_city_sequence = _get_last_inner_city_sequence(service.trip)
+    return last_inner_city_sequence is not None and last_inner_city_sequence > service.sequence
 
-    return False
 
-
-def _render_train_bar(stop: Stop, now: datetime.datetime, service: StopTimeInstance) -> str:
-    """Renders a train bar.
+@lru_cache(maxsize=4096)
+def _get_train_destination(service: StopTimeInstance) -> str:
+    """Returns the destination text for a train bar.
+    The destination only depends on the trip and the remaining stops, so it is cached per stop time instance.
+    Instances are hashed by identity, so entries from before a GTFS data reload are never reused.
 
     Parameters
     ----------
-    stop: Stop
-        The stop to render the bar for.
-    now : datetime.datetime
-        The current time.
     service : StopTimeInstance
-        The service to render.
+        The service to get the destination for.
 
     Returns
     -------
     str
-        The rendered bar.
+        The destination text.
     """
-    scheduled_time = service.scheduled_departure_time.strftime("%I:%M")
-
-    last_stop = service.trip.destination
-    while last_stop.parent_station is not None:
-        last_stop = last_stop.parent_station
+    last_stop = _get_root_station(service.trip.destination)
     destination = _get_station_name(last_stop)
 
     if last_stop.id in DESTINATION_PREPEND_STATIONS:
         prepend_station = DESTINATION_PREPEND_STATIONS[last_stop.id]
         for stop_time_instance in service.trip.stop_times:
             if stop_time_instance.sequence > service.sequence:
-                stop = stop_time_instance.stop
-                while stop.parent_station is not None:
-                    stop = stop.parent_station
+                stop = _get_root_station(stop_time_instance.stop)
 
                 if stop.id == prepend_station:
                     destination = f"{_get_station_name(stop)} / " + destination
@@ -588,19 +841,35 @@ def _render_train_bar(stop: Stop, now: datetime.datetime, service: StopTimeInsta
     if _is_city_service(service):
         destination = "City & " + destination
 
-    departs_minutes = (service.actual_departure_time - now).seconds // 60
-    if departs_minutes < 60:
-        departs = f"{departs_minutes} min"
-    else:
-        departs = service.actual_departure_time.strftime("%I:%M")
-
-    return (
-        _with_formatting(
-            f"{scheduled_time:<7}{destination:<{_SCREEN_WIDTH - 20}}{service.stop.platform_code:<7}{departs:>6}",
-            _DiscordAnsiColour.from_service(service),
-        )
-        + "\n"
-    )
+    return destination
+
+
+def _render_train_bar(stop: Stop, now: datetime.datetime, service: StopTimeInstance) -> str:
+    """Renders a train bar.
+
+    Parameters
+    ----------
+    stop: Stop
+        The stop to render the bar for.
+    now : datetime.datetime
+        The current time.
+    service : StopTimeInstance
+        The service to render.
+
+    Returns
+    -------
+    str
+        The rendered bar.
+    """
+    scheduled_departure_time = service.scheduled_departure_time
+    scheduled_time = _TWELVE_HOUR_TIMES[scheduled_departure_time.hour * 60 + scheduled_departure_time.minute]
+    destination = _get_train_destination(service)
+
+    departs = _get_departs_text(service.actual_departure_time, now, _TWELVE_HOUR_TIMES)
+
+    # The bar is fixed width and ends with the right-aligned departure text, so there is no trailing whitespace to strip.
+    prefix = _PREFIXES[False, False][_DiscordAnsiColour.from_service(service).code]
+    return _TRAIN_BAR_LINE_FORMAT % (prefix, scheduled_time, destination, service.stop.platform_code, departs)
 
 
 def _render_train_bars(stop: Stop, now: datetime.datetime, services: Sequence[StopTimeInstance], max_bars: int) -> str:
@@ -622,16 +891,83 @@ def _render_train_bars(stop: Stop, now: datetime.datetime, services: Sequence[St
     str
         The rendered bars.
     """
-    text = ""
+    bars = [_render_train_bar(stop, now, service) for service in services[:max_bars]]
+    # Pad with blank lines so the timetable keeps its height, repeating a negative number of times gives an empty string.
+    bars.append(_BLANK_BAR * (max_bars - len(services)))
+
+    return "".join(bars)
+
+
+def _get_time_prefix(now: datetime.datetime) -> str:
+    """Returns the formatted clock shown at the start of a train timetable.
+
+    Parameters
+    ----------
+    now : datetime.datetime
+        The current time.
+
+    Returns
+    -------
+    str
+        The formatted clock.
+    """
+    clock = f"{_TWELVE_HOUR_TIMES[now.hour * 60 + now.minute]}:{now.second:02}"
+    return _with_formatting(f"[{clock}]", _DiscordAnsiColour.YELLOW, bold=True)
+
+
+@lru_cache(maxsize=None)
+def _get_train_title(stop_id: str, max_services: int, direction: Direction | None) -> str:
+    """Returns the formatted title of a train timetable.
+
+    Parameters
+    ----------
+    stop_id : str
+        The stop ID.
+    max_services : int
+        The maximum number of services shown in the timetable.
+    direction : Direction, optional
+        The direction shown, or None if both directions are shown.
+
+    Returns
+    -------
+    str
+        The formatted title.
+    """
+    if direction is not None:
+        title = f"Next Trains {_get_header_text(stop_id, max_services)[direction]}"
+    elif _LINES[stop_id] is _Line.INNER_CITY:
+        title = f"Next {max_services // 2} Trains North and South/West"
+    else:
+        title = f"Next {max_services // 2} Inbound and Outbound Trains"
+
+    return _with_formatting(_TITLE_FORMAT.format(title), _DiscordAnsiColour.WHITE)
+
+
+_TRAIN_COLUMN_HEADER = "Service                        Platform  Departs\n"
 
-    for service in services[:max_bars]:
-        text += _render_train_bar(stop, now, service)
-    for _ in range(max_bars - len(services)):
-        text += _ZWSP + "\n"
 
-    return text
+@lru_cache(maxsize=None)
+def _get_section_header(stop_id: str, max_services: int, direction: Direction) -> str:
+    """Returns the column header line for one direction of a combined train timetable.
 
+    Parameters
+    ----------
+    stop_id : str
+        The stop ID.
+    max_services : int
+        The maximum number of services shown for the direction.
+    direction : Direction
+        The direction of the section.
+
+    Returns
+    -------
+    str
+        The header line.
+    """
+    return _SECTION_HEADER_FORMAT.format(_get_header_text(stop_id, max_services, slim=True)[direction])
 
+
+@lru_cache(maxsize=64)
 def _render_no_trains_text(direction: str, lookahead_hours: int, slim: bool = False) -> str:
     """Renders the no trains text.
 
@@ -649,15 +985,7 @@ def _render_no_trains_text(direction: str, lookahead_hours: int, slim: bool = Fa
     str
         The rendered text.
     """
-    if slim:
-        text = NO_TRAINS_SLIM_TEXT
-    else:
-        text = NO_TRAINS_TEXT
-
-    return "\n".join(
-        _with_formatting(f"{line.format(direction=direction, lookahead=lookahead_hours):^{_SCREEN_WIDTH}}", _DiscordAnsiColour.WHITE)
-        for line in text
-    )
+    return _render_notice(_NO_TRAINS_SLIM_NOTICE if slim else _NO_TRAINS_NOTICE, {"direction": direction, "lookahead": lookahead_hours})
 
 
 def _render_train_timetable(
@@ -693,72 +1021,42 @@ def _render_train_timetable(
     str
         The rendered timetable.
     """
+    upward = Direction.UPWARD
     inbound_direction = _get_inbound_direction(stop.id)
-    outbound_direction = Direction.DOWNWARD if inbound_direction is Direction.UPWARD else Direction.UPWARD
+    outbound_direction = Direction.DOWNWARD if inbound_direction is upward else upward
 
-    if _LINES[stop.id] is _Line.INNER_CITY:
+    if stop.id in _INNER_CITY_STATIONS:
         up_text = "SOUTHBOUND"
         down_text = "NORTHBOUND"
     else:
-        up_text = "INBOUND" if inbound_direction is Direction.UPWARD else "OUTBOUND"
-        down_text = "OUTBOUND" if inbound_direction is Direction.UPWARD else "INBOUND"
+        up_text = "INBOUND" if inbound_direction is upward else "OUTBOUND"
+        down_text = "OUTBOUND" if inbound_direction is upward else "INBOUND"
+
+    parts = [_get_time_prefix(now), _get_train_title(stop.id, max_services, direction), "\n"]
 
     if direction is not None:
-        text = (
-            _with_formatting(f"[{now.strftime("%I:%M:%S")}]", _DiscordAnsiColour.YELLOW, bold=True)
-            + _with_formatting(
-                f"{f"Next Trains {_get_header_text(stop.id, max_services)[direction]}":^{_SCREEN_WIDTH - 10}}",
-                _DiscordAnsiColour.WHITE,
-            )
-            + "\n"
-        )
 
-        services = upward_services if direction is Direction.UPWARD else downward_services
+        services = upward_services if direction is upward else downward_services
 
         if services:
-            text += "Service                        Platform  Departs\n"
-            text += _render_train_bars(stop, now, services, max_services)
+            parts.append(_TRAIN_COLUMN_HEADER)
+            parts.append(_render_train_bars(stop, now, services, max_services))
 
         else:
-            text += _render_no_trains_text(up_text if direction is Direction.UPWARD else down_text, lookahead_hours) + "\n"
+            parts.append(_render_no_trains_text(up_text if direction is upward else down_text, lookahead_hours))
+            parts.append("\n")
 
     else:
-        if _LINES[stop.id] is _Line.INNER_CITY:
-            text = (
-                _with_formatting(f"[{now.strftime("%I:%M:%S")}]", _DiscordAnsiColour.YELLOW, bold=True)
-                + _with_formatting(
-                    f"{f"Next {max_services // 2} Trains North and South/West":^{_SCREEN_WIDTH - 10}}", _DiscordAnsiColour.WHITE
-                )
-                + "\n"
-            )
-        else:
-            text = (
-                _with_formatting(f"[{now.strftime("%I:%M:%S")}]", _DiscordAnsiColour.YELLOW, bold=True)
-                + _with_formatting(
-                    f"{f"Next {max_services // 2} Inbound and Outbound Trains":^{_SCREEN_WIDTH - 10}}", _DiscordAnsiColour.WHITE
-                )
-                + "\n"
-            )
-
-        text += f"{f"Next Trains {_get_header_text(stop.id, max_services // 2, slim=True)[inbound_direction]:<{_SCREEN_WIDTH - 29}}"}Platform  Departs\n"
-        inbound_services = upward_services if inbound_direction is Direction.UPWARD else downward_services
-        if inbound_services:
-            text += _render_train_bars(stop, now, inbound_services, max_services // 2)
-        else:
-            text += (
-                _render_no_trains_text(up_text if inbound_direction is Direction.UPWARD else down_text, lookahead_hours, slim=True) + "\n"
-            )
-
-        text += f"{f"Next Trains {_get_header_text(stop.id, max_services // 2, slim=True)[outbound_direction]:<{_SCREEN_WIDTH - 29}}"}Platform  Departs\n"
-        outbound_services = upward_services if outbound_direction is Direction.UPWARD else downward_services
-        if outbound_services:
-            text += _render_train_bars(stop, now, outbound_services, max_services // 2)
-        else:
-            text += (
-                _render_no_trains_text(up_text if outbound_direction is Direction.UPWARD else down_text, lookahead_hours, slim=True) + "\n"
-            )
+        for section_direction in (inbound_direction, outbound_direction):
+            parts.append(_get_section_header(stop.id, max_services // 2, section_direction))
+            section_services = upward_services if section_direction is upward else downward_services
+            if section_services:
+                parts.append(_render_train_bars(stop, now, section_services, max_services // 2))
+            else:
+                parts.append(_render_no_trains_text(up_text if section_direction is upward else down_text, lookahead_hours, slim=True))
+                parts.append("\n")
 
-    return text
+    return "".join(parts)
 
 
 NO_SERVICES_TEXT = [
@@ -769,6 +1067,25 @@ NO_SERVICES_TEXT = [
     _ZWSP,
 ]
 
+_NO_SERVICES_NOTICE = _compile_notice(NO_SERVICES_TEXT)
+
+
+@lru_cache(maxsize=32)
+def _render_no_services_text(lookahead_hours: int) -> str:
+    """Renders the no services text.
+
+    Parameters
+    ----------
+    lookahead_hours : int
+        The number of hours ahead services are being displayed for.
+
+    Returns
+    -------
+    str
+        The rendered text.
+    """
+    return _render_notice(_NO_SERVICES_NOTICE, {"lookahead": lookahead_hours})
+
 
 def _render_bus_timetable(
     stop: Stop,
@@ -794,41 +1111,53 @@ def _render_bus_timetable(
     str
         The rendered timetable.
     """
-    text = _with_formatting("Route  Destination                       Departs", _DiscordAnsiColour.WHITE, bold=True) + "\n"
+    lines = [_with_formatting("Route  Destination                       Departs", _DiscordAnsiColour.WHITE, bold=True)]
     for service in services:
-        departs_minutes = (service.actual_departure_time - now).seconds // 60
-        if departs_minutes < 60:
-            departs = f"{departs_minutes} min"
-        else:
-            departs = service.actual_departure_time.strftime("%H:%M")
-        text += (
-            _with_formatting(
-                f"{service.trip.route.short_name:<7}{service.trip.headsign:<{_SCREEN_WIDTH-13}}{departs:>6}",
-                _DiscordAnsiColour.from_service(service),
-            )
-            + "\n"
-        )
+        trip = service.trip
+        departs = _get_departs_text(service.actual_departure_time, now, _TWENTY_FOUR_HOUR_TIMES)
+        # The trip is already in hand, so resolve its colour directly rather than going back through the service.
+        lines.append(_with_formatting(_BUS_ROW_FORMAT % (trip.route.short_name, trip.headsign, departs), _get_trip_colour(trip)))
 
     if not services:
+        lines.append(_render_no_services_text(lookahead_hours))
+    else:
+        # Service rows are newline terminated
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+# Each footer is pre-joined so that a render only needs to pick one.
+_TRAM_FOOTERS = tuple(
+    "\n".join(footer)
+    for footer in (
+        (
+            f"{"For your safety":^{_SCREEN_WIDTH}}",
+            f"{'CCTV is in operation at all times':^{_SCREEN_WIDTH}}",
+        ),
+        (
+            f"{"NO SMOKING":^{_SCREEN_WIDTH}}",
+            f"{'No smoking':>{_SCREEN_WIDTH}}",
+        ),
+    )
+)
 
-        text += "\n".join(
-            _with_formatting(f"{line.format(lookahead=lookahead_hours):^{_SCREEN_WIDTH}}", _DiscordAnsiColour.WHITE)
-            for line in NO_SERVICES_TEXT
-        )
 
-    return text
+def _get_tram_clock(now: datetime.datetime) -> str:
+    """Returns the formatted clock shown beneath the services of a tram timetable.
 
+    Parameters
+    ----------
+    now : datetime.datetime
+        The current time.
 
-_TRAM_FOOTERS = [
-    [
-        f"{"For your safety":^{_SCREEN_WIDTH}}",
-        f"{'CCTV is in operation at all times':^{_SCREEN_WIDTH}}",
-    ],
-    [
-        f"{"NO SMOKING":^{_SCREEN_WIDTH}}",
-        f"{'No smoking':>{_SCREEN_WIDTH}}",
-    ],
-]
+    Returns
+    -------
+    str
+        The formatted clock.
+    """
+    clock = f"{_TWELVE_HOUR_TIMES[now.hour * 60 + now.minute]}:{now.second:02} {"am" if now.hour < 12 else "pm"}"
+    return _with_formatting(_CENTRED_FORMAT.format(clock), _DiscordAnsiColour.WHITE)
 
 
 def _render_tram_timetable(now: datetime.datetime, stop_times: Sequence[StopTimeInstance]) -> str:
@@ -846,7 +1175,7 @@ def _render_tram_timetable(now: datetime.datetime, stop_times: Sequence[StopTime
     str
         The rendered timetable.
     """
-    text = ""
+    lines = []
 
     for i in range(2):
         if i < len(stop_times):
@@ -854,75 +1183,18 @@ def _render_tram_timetable(now: datetime.datetime, stop_times: Sequence[StopTime
 
             destination = stop_time.trip.headsign
 
-            departs_minutes = (stop_time.actual_departure_time - now).seconds // 60
-            if departs_minutes < 60:
-                departs = f"{departs_minutes} min"
-            else:
-                departs = stop_time.actual_departure_time.strftime("%H:%M")
+            departs = _get_departs_text(stop_time.actual_departure_time, now, _TWENTY_FOUR_HOUR_TIMES)
 
-            text += (
-                _with_formatting(
-                    f"Plat{stop_time.stop.platform_code:<3}{destination:<{_SCREEN_WIDTH-14}}{departs:>6}", _DiscordAnsiColour.YELLOW
-                )
-                + "\n"
+            lines.append(
+                _with_formatting(_TRAM_ROW_FORMAT % (stop_time.stop.platform_code, destination, departs), _DiscordAnsiColour.YELLOW)
             )
         else:
-            text += f"{_ZWSP}\n"
+            lines.append(_ZWSP)
 
-    text += _with_formatting(f"{now.strftime("%I:%M:%S %p").lower():^{_SCREEN_WIDTH}}", _DiscordAnsiColour.WHITE) + "\n"
-    text += "\n".join(line for line in choice(_TRAM_FOOTERS))
+    lines.append(_get_tram_clock(now))
+    lines.append(choice(_TRAM_FOOTERS))
 
-    return text
-
-
-def _render_ferry_timetable(
-    stop: Stop,
-    now: datetime.datetime,
-    services: Sequence[StopTimeInstance],
-    lookahead_hours: int,
-) -> str:
-    """Renders a ferry timetable for a stop.
-
-    Parameters
-    ----------
-    stop : Stop
-        The stop to render the timetable for.
-    now : datetime.datetime
-        The current time.
-    stop_times : Sequence[StopTimeInstance]
-        The stop times to render.
-    lookahead_hours : int
-        The number of hours ahead services are being displayed for.
-
-    Returns
-    -------
-    str
-        The rendered timetable.
-    """
-    return _render_bus_timetable(stop, now, services, lookahead_hours)
-
-
-@overload
-def render_timetable(
-    stop: Stop,
-    now: datetime.datetime,
-    services: Sequence[StopTimeInstance],
-    type: Literal[RouteType.RAIL],
-    lookahead_hours: int,
-    max_services: int,
-    direction: Direction | None = ...,
-) -> str: ...
-
-
-@overload
-def render_timetable(
-    stop: Stop,
-    now: datetime.datetime,
-    services: Sequence[StopTimeInstance],
-    type: RouteType,
-    lookahead_hours: int,
-    max_services: int,
-) -> str: ...
+    return "\n".join(lines)
 
 
 def render_timetable(
@@ -951,7 +1223,7 @@ def render_timetable(
     max_services: int
         The maximum number of services to display.
     direction : Direction, optional
-        The direction of the route, this only applies to trains.
+        The direction of the route, this only applies to trains and is ignored for other route types.
 
     Returns
     -------
@@ -959,17 +1231,25 @@ def render_timetable(
         The rendered timetable.
     """
     if type is RouteType.RAIL:
-        if direction is None and stop.id in _END_OF_LINE:
-            direction = _get_inbound_direction(stop.id)
+        if direction is None:
+            # Termini only have services in one direction, so default to it.
+            direction = _END_OF_LINE_DIRECTIONS.get(stop.id)
+
+        upward_services: list[StopTimeInstance] = []
+        downward_services: list[StopTimeInstance] = []
+        upward = Direction.UPWARD
+        for service in services:
+            (upward_services if service.trip.direction is upward else downward_services).append(service)
 
-        upward_services = [service for service in services if service.trip.direction is Direction.UPWARD]
-        downward_services = [service for service in services if service.trip.direction is Direction.DOWNWARD]
         return _render_train_timetable(stop, now, upward_services, downward_services, lookahead_hours, max_services, direction)
-    elif type is RouteType.BUS:
+
+    # Rail trims each direction itself, other timetables only ever show up to max_services rows.
+    services = services[:max_services]
+
+    # Ferries share the bus layout.
+    if type is RouteType.BUS or type is RouteType.FERRY:
         return _render_bus_timetable(stop, now, services, lookahead_hours)
     elif type is RouteType.TRAM:
         return _render_tram_timetable(now, services)
-    elif type is RouteType.FERRY:
-        return _render_ferry_timetable(stop, now, services, lookahead_hours)
     else:
         raise ValueError(f"Unsupported route type: {type}")
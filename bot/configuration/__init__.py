@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import tzinfo
+from functools import cached_property
 from os import environ
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
@@ -38,7 +39,7 @@ class Configuration:
         except Exception:
             pass
 
-    @property
+    @cached_property
     def local_timezone(self) -> tzinfo:
         """tzinfo: The local timezone."""
         return ZoneInfo("Australia/Brisbane")
@@ -1,4 +1,5 @@
 import datetime
+from collections.abc import Sequence
 from itertools import islice
 
 from audino import HealthTracker
@@ -14,11 +15,13 @@ from ..mediator import (
     GetNextServicesResult,
     GetNextTrainsRequest,
     GetNextTrainsResult,
+    SearchStopsBatchRequest,
+    SearchStopsBatchResult,
     SearchStopsRequest,
     SearchStopsResult,
 )
 from .store import GtfsDataStore
-from .types import Direction, RouteType
+from .types import Direction, RouteType, Stop
 
 __all__ = ("GtfsProvider",)
 
@@ -50,30 +53,51 @@ class GtfsProvider(Service):
         self._health_tracker = health_tracker
         self._data_store = data_store
         self._config = config
+        self._searchable_stops: dict[tuple[RouteType, bool], tuple[Sequence[Stop], dict[Stop, str]]] = {}
         super().__init__()
 
     # region: Mediator message handlers
 
-    async def _handle_search_stops_request(self, request: SearchStopsRequest) -> SearchStopsResult:
-        if not await self._health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE):
-            raise RuntimeError("GTFS data is currently unavailable.")
-
-        stops = {
-            stop: stop.name
-            for stop in self._data_store.get_stops_by_route_type(request.route_type)
-            if stop.parent_station is None or not request.parent_only
-        }
+    def _search_stops(self, query: str, route_type: RouteType, limit: int | None, stops: dict[Stop, str]) -> list[Stop]:
         results = []
 
-        if (
-            stop := self._data_store.get_stop(request.query, error_on_missing=False)
-        ) is not None and self._data_store.stop_has_route_with_type(stop.id, request.route_type):
+        stop = self._data_store.get_stop(query, error_on_missing=False)
+        if stop is not None and self._data_store.stop_has_route_with_type(stop.id, route_type):
             results.append(stop)
 
-        for _, _, stop in process.extract(request.query, stops, scorer=fuzz.WRatio, processor=utils.default_process, limit=request.limit):
+        # The stop names are already processed, so only the query needs processing.
+        for _, _, stop in process.extract(utils.default_process(query), stops, scorer=fuzz.WRatio, processor=None, limit=limit):
             results.append(stop)
 
-        return SearchStopsResult(stops=results[: request.limit])
+        return results[:limit]
+
+    def _get_searchable_stops(self, route_type: RouteType, parent_only: bool) -> dict[Stop, str]:
+        # The data store returns the same sequence until its stops change, so the processed names can be reused until then.
+        stops = self._data_store.get_stops_by_route_type(route_type)
+        cached = self._searchable_stops.get((route_type, parent_only))
+        if cached is not None and cached[0] is stops:
+            return cached[1]
+
+        searchable = {stop: utils.default_process(stop.name) for stop in stops if stop.parent_station is None or not parent_only}
+        self._searchable_stops[route_type, parent_only] = (stops, searchable)
+        return searchable
+
+    async def _handle_search_stops_request(self, request: SearchStopsRequest) -> SearchStopsResult:
+        if not await self._health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE):
+            raise RuntimeError("GTFS data is currently unavailable.")
+
+        stops = self._get_searchable_stops(request.route_type, request.parent_only)
+        return SearchStopsResult(stops=self._search_stops(request.query, request.route_type, request.limit, stops))
+
+    async def _handle_search_stops_batch_request(self, request: SearchStopsBatchRequest) -> SearchStopsBatchResult:
+        if not await self._health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE):
+            raise RuntimeError("GTFS data is currently unavailable.")
+
+        # The searchable stops are only built once for the whole batch.
+        stops = self._get_searchable_stops(request.route_type, request.parent_only)
+        return SearchStopsBatchResult(
+            stops=[self._search_stops(query, request.route_type, request.limit, stops) for query in request.queries]
+        )
 
     async def _handle_get_next_services_request(self, request: GetNextServicesRequest) -> GetNextServicesResult:
         if not await self._health_tracker.get_health(HealthStatusId.GTFS_AVAILABLE):
@@ -142,6 +166,7 @@ class GtfsProvider(Service):
             The maximum time to wait for the service to start.
         """
         self._mediator.create_subscription(ChannelNames.GTFS, SearchStopsRequest, self._handle_search_stops_request)
+        self._mediator.create_subscription(ChannelNames.GTFS, SearchStopsBatchRequest, self._handle_search_stops_batch_request)
         self._mediator.create_subscription(ChannelNames.GTFS, GetNextTrainsRequest, self._handle_get_next_trains_request)
         self._mediator.create_subscription(ChannelNames.GTFS, GetNextServicesRequest, self._handle_get_next_services_request)
 
@@ -154,5 +179,6 @@ class GtfsProvider(Service):
             The maximum time to wait for the service to stop.
         """
         self._mediator.unsubscribe(ChannelNames.GTFS, SearchStopsRequest, self._handle_search_stops_request)
+        self._mediator.unsubscribe(ChannelNames.GTFS, SearchStopsBatchRequest, self._handle_search_stops_batch_request)
         self._mediator.unsubscribe(ChannelNames.GTFS, GetNextTrainsRequest, self._handle_get_next_trains_request)
         self._mediator.unsubscribe(ChannelNames.GTFS, GetNextServicesRequest, self._handle_get_next_services_request)
@@ -1,6 +1,7 @@
 import datetime
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
+from sys import intern
 from typing import Literal, overload
 
 from ..configuration import Configuration
@@ -57,6 +58,7 @@ class GtfsDataStore:
         self._children_stops: dict[str, list[Stop]] = defaultdict(list)
         self._stop_times_by_trip: dict[str, list[StopTime]] = defaultdict(list)
         self._route_types_by_stop: dict[str, set[RouteType]] = defaultdict(set)
+        self._stops_by_route_type: dict[RouteType, list[Stop]] = {}
 
         # Real-time data
         self._trip_instances_by_date: dict[datetime.date, dict[str, TripInstance]] = defaultdict(dict)
@@ -77,6 +79,7 @@ class GtfsDataStore:
         self._children_stops.clear()
         self._stop_times_by_trip.clear()
         self._route_types_by_stop.clear()
+        self._stops_by_route_type.clear()
         self._trip_instances_by_date.clear()
         self._stop_time_instances_by_date.clear()
         self._stop_time_instances_by_stop.clear()
@@ -90,7 +93,7 @@ class GtfsDataStore:
             The route data to add to the data store.
         """
         route = Route(
-            id=data["route_id"].lower(),
+            id=intern(data["route_id"].lower()),
             short_name=data["route_short_name"],
             long_name=data["route_long_name"],
             type=RouteType(int(data["route_type"])),
@@ -119,7 +122,7 @@ class GtfsDataStore:
             The service data to add to the data store.
         """
         service = Service(
-            id=data["service_id"].lower(),
+            id=intern(data["service_id"].lower()),
             days=[_DAYS.index(day) for day in _DAYS if data[day] == "1"],
             start_date=datetime.datetime.strptime(data["start_date"], "%Y%m%d").date(),
             end_date=datetime.datetime.strptime(data["end_date"], "%Y%m%d").date(),
@@ -136,9 +139,9 @@ class GtfsDataStore:
             The trip data to add to the data store.
         """
         trip = Trip(
-            id=data["trip_id"].lower(),
-            route_id=data["route_id"].lower(),
-            service_id=data["service_id"].lower(),
+            id=intern(data["trip_id"].lower()),
+            route_id=intern(data["route_id"].lower()),
+            service_id=intern(data["service_id"].lower()),
             headsign=data["trip_headsign"],
             direction=Direction.DOWNWARD if data["direction_id"] == "1" else Direction.UPWARD,
         )
@@ -156,17 +159,18 @@ class GtfsDataStore:
             The stop data to add to the data store.
         """
         stop = Stop(
-            id=data["stop_id"].lower(),
+            id=intern(data["stop_id"].lower()),
             name=data["stop_name"],
             url=data["stop_url"],
             type=LocationType(int(data["location_type"])),
-            parent_station_id=data["parent_station"].lower() or None,
+            parent_station_id=intern(data["parent_station"].lower()) or None,
             platform_code=data["platform_code"] or None,
         )
 
         self._stops[stop.id] = stop.register(self)
         if stop._parent_station_id is not None:
             self._children_stops[stop._parent_station_id].append(stop)
+        self._stops_by_route_type.clear()
 
     def add_stop_time(self, data: StopTimeData) -> None:
         """Adds a stop time to the data store and updates the stop time instances.
@@ -177,9 +181,9 @@ class GtfsDataStore:
             The stop time data to add to the data store.
         """
         stop_time = StopTime(
-            trip_id=data["trip_id"].lower(),
+            trip_id=intern(data["trip_id"].lower()),
             sequence=int(data["stop_sequence"]),
-            stop_id=data["stop_id"].lower(),
+            stop_id=intern(data["stop_id"].lower()),
             arrival_time=_load_time(data["arrival_time"]),
             departure_time=_load_time(data["departure_time"]),
             terminates=data["pickup_type"] == "1",
@@ -187,7 +191,10 @@ class GtfsDataStore:
 
         self._stop_times_by_trip[stop_time._trip_id].append(stop_time)
         route_type = self._routes[stop_time.trip._route_id].type
-        self._route_types_by_stop[stop_time._stop_id].add(route_type)
+        route_types = self._route_types_by_stop[stop_time._stop_id]
+        if route_type not in route_types:
+            route_types.add(route_type)
+            self._stops_by_route_type.pop(route_type, None)
 
     def remove_old_trip_instances(self) -> None:
         """Removes trip instances for dates older than yesterday."""
@@ -465,9 +472,12 @@ class GtfsDataStore:
         """
         return route_type in self._route_types_by_stop[stop_id.lower()]
 
-    def get_stops_by_route_type(self, route_type: RouteType) -> list[Stop]:
+    def get_stops_by_route_type(self, route_type: RouteType) -> Sequence[Stop]:
         """Gets all stops for a route type
 
+        The stops are cached until the stops or their route types change,
+        so the same sequence is returned until then and it must not be modified.
+
         Parameters
         ----------
         route_type : RouteType
@@ -475,15 +485,18 @@ class GtfsDataStore:
 
         Returns
         -------
-        list[Stop]
+        Sequence[Stop]
             The stops for the specified route type.
         """
-        return [
-            stop
-            for stop in self._stops.values()
-            for stop_id in self._walk_child_stop_ids(stop.id)
-            if self.stop_has_route_with_type(stop_id, route_type)
-        ]
+        stops = self._stops_by_route_type.get(route_type)
+        if stops is None:
+            stops = self._stops_by_route_type[route_type] = [
+                stop
+                for stop in self._stops.values()
+                for stop_id in self._walk_child_stop_ids(stop.id)
+                if self.stop_has_route_with_type(stop_id, route_type)
+            ]
+        return stops
 
     def get_trips_by_route(self, route_id: str) -> Sequence[Trip]:
         """Gets all trips for a route
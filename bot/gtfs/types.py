@@ -54,7 +54,10 @@ class LocationType(Enum):
 
 
 class _GtfsData:
-    _data_store: GtfsDataStore | None = None
+    __slots__ = ("_data_store",)
+
+    def __init__(self) -> None:
+        self._data_store: GtfsDataStore | None = None
 
     def register(self, data_store: GtfsDataStore) -> Self:
         """Registers this object with the given GTFS data store.
@@ -76,7 +79,8 @@ class _GtfsData:
         return self
 
     def __repr__(self) -> str:
-        return f"<{self.__class__.__name__} {self.__dict__}>"
+        attributes = {name: getattr(self, name) for cls in reversed(type(self).__mro__) for name in getattr(cls, "__slots__", ())}
+        return f"<{self.__class__.__name__} {attributes}>"
 
 
 class RouteData(TypedDict):
@@ -102,6 +106,8 @@ class Route(_GtfsData):
         The type of the route.
     """
 
+    __slots__ = ("id", "short_name", "long_name", "type", "colour")
+
     def __init__(
         self,
         /,
@@ -129,6 +135,7 @@ class Route(_GtfsData):
         color: str
             The color of the route, as a hex string.
         """
+        super().__init__()
         self.id: str = id
         self.short_name: str = short_name
         self.long_name: str = long_name
@@ -178,6 +185,8 @@ class Service(_GtfsData):
         The end date of the service.
     """
 
+    __slots__ = ("id", "days", "start_date", "end_date")
+
     def __init__(
         self,
         /,
@@ -187,6 +196,7 @@ class Service(_GtfsData):
         start_date: datetime.date,
         end_date: datetime.date,
     ) -> None:
+        super().__init__()
         self.id: str = id
         self.days: set[int] = set(days)
         self.start_date: datetime.date = start_date
@@ -252,6 +262,8 @@ class Trip(_GtfsData):
         The direction of the trip.
     """
 
+    __slots__ = ("id", "_route_id", "_service_id", "headsign", "direction")
+
     def __init__(
         self,
         /,
@@ -277,6 +289,7 @@ class Trip(_GtfsData):
         direction : Direction
             The direction of the trip.
         """
+        super().__init__()
         self.id: str = id
         self._route_id: str = route_id
         self._service_id: str = service_id
@@ -334,6 +347,8 @@ class Stop(_GtfsData):
         The platform code.
     """
 
+    __slots__ = ("id", "name", "url", "type", "_parent_station_id", "platform_code")
+
     def __init__(
         self,
         /,
@@ -362,6 +377,7 @@ class Stop(_GtfsData):
         platform_code : str | None
             The platform code.
         """
+        super().__init__()
         self.id: str = id
         self.name: str = name
         self.url: str = url
@@ -390,6 +406,8 @@ class StopTimeData(TypedDict):
 
 
 class StopTime(_GtfsData):
+    __slots__ = ("_trip_id", "sequence", "_stop_id", "arrival_time", "departure_time", "terminates")
+
     def __init__(
         self,
         /,
@@ -401,6 +419,7 @@ class StopTime(_GtfsData):
         departure_time: datetime.timedelta,
         terminates: bool,
     ) -> None:
+        super().__init__()
         self._trip_id: str = trip_id
         self.sequence: int = sequence
         self._stop_id: str = stop_id
@@ -451,6 +470,8 @@ class TripInstance(Trip):
         Whether the trip instance has been or will be cancelled.
     """
 
+    __slots__ = ("date", "cancelled")
+
     def __init__(self, trip: Trip, date: datetime.date) -> None:
         """Initializes the trip instance.
 
@@ -511,6 +532,8 @@ class StopTimeInstance(StopTime):
         Whether the stop time instance has been or will be skipped.
     """
 
+    __slots__ = ("date", "skipped", "_actual_arrival_time", "_actual_departure_time", "_scheduled_arrival_time", "_scheduled_departure_time")
+
     def __init__(self, stop_time: StopTime, date: datetime.date) -> None:
         """Initializes the stop time instance.
 
@@ -533,22 +556,34 @@ class StopTimeInstance(StopTime):
         self.skipped: bool = False
         self._actual_arrival_time: datetime.datetime | None = None
         self._actual_departure_time: datetime.datetime | None = None
+        self._scheduled_arrival_time: datetime.datetime | None = None
+        self._scheduled_departure_time: datetime.datetime | None = None
 
     @property
     def scheduled_arrival_time(self) -> datetime.datetime:
         """datetime.datetime: The scheduled arrival time of the stop time instance."""
-        if self._data_store is None:
-            raise RuntimeError("This stop time instance is not registered with a GTFS data store.")
+        if self._scheduled_arrival_time is None:
+            if self._data_store is None:
+                raise RuntimeError("This stop time instance is not registered with a GTFS data store.")
+
+            self._scheduled_arrival_time = (
+                datetime.datetime.combine(self.date, datetime.time(), tzinfo=self._data_store._config.local_timezone) + self.arrival_time
+            )
 
-        return datetime.datetime.combine(self.date, datetime.time(), tzinfo=self._data_store._config.local_timezone) + self.arrival_time
+        return self._scheduled_arrival_time
 
     @property
     def scheduled_departure_time(self) -> datetime.datetime:
         """datetime.datetime: The scheduled departure time of the stop time instance."""
-        if self._data_store is None:
-            raise RuntimeError("This stop time instance is not registered with a GTFS data store.")
+        if self._scheduled_departure_time is None:
+            if self._data_store is None:
+                raise RuntimeError("This stop time instance is not registered with a GTFS data store.")
+
+            self._scheduled_departure_time = (
+                datetime.datetime.combine(self.date, datetime.time(), tzinfo=self._data_store._config.local_timezone) + self.departure_time
+            )
 
-        return datetime.datetime.combine(self.date, datetime.time(), tzinfo=self._data_store._config.local_timezone) + self.departure_time
+        return self._scheduled_departure_time
 
     @property
     def actual_arrival_time(self) -> datetime.datetime:
@@ -1,6 +1,4 @@
 from .hook import *
 from .wave import Wave
 
-ALL_HOOKS = [
-    Wave,
-]
+ALL_HOOKS = (Wave,)
@@ -13,6 +13,8 @@ __all__ = (
     "ChannelNames",
     "SearchStopsRequest",
     "SearchStopsResult",
+    "SearchStopsBatchRequest",
+    "SearchStopsBatchResult",
     "GetNextServicesRequest",
     "GetNextServicesResult",
     "GetNextTrainsRequest",
@@ -76,6 +78,53 @@ class SearchStopsRequest(SingleResponseRequest[SearchStopsResult]):
         self.limit: int | None = limit
 
 
+class SearchStopsBatchResult(NamedTuple):
+    """GTFS stop search results for a batch of queries.
+
+    Attributes
+    ----------
+    stops : list[list[Stop]]
+        The stops that match each search query, in the same order as the queries.
+    """
+
+    stops: list[list[Stop]]
+
+
+class SearchStopsBatchRequest(SingleResponseRequest[SearchStopsBatchResult]):
+    """Represents a request to search for GTFS stops matching any of several queries.
+
+    Attributes
+    ----------
+    queries : list[str]
+        The search queries to use.
+    route_type : RouteType
+        The route type to search for.
+    parent_only : bool
+        Whether to only return parent stops.
+    limit : int | None
+        The maximum number of results to return for each query.
+    """
+
+    def __init__(self, queries: list[str], route_type: RouteType, parent_only: bool = False, limit: int | None = None):
+        """Initializes the search stops batch request.
+
+        Parameters
+        ----------
+        queries : list[str]
+            The search queries to use.
+        route_type : RouteType
+            The route type to search for.
+        parent_only : bool, optional
+            Whether to only return parent stops, by default False.
+        limit : int | None, optional
+            The maximum number of results to return for each query, by default None.
+        """
+        self.queries: list[str] = queries
+        self.route_type: RouteType = route_type
+        self.parent_only: bool = parent_only
+        self.limit: int | None = limit
+
+
 # endregion
 
 